@@ -1,13 +1,81 @@
 import sys
 import asyncio
 import concurrent.futures
+import html
+import random
+import re
 import time
-from math import floor
 from multiprocessing import cpu_count
 
 import aiofiles
-import aiohttp
-from bs4 import BeautifulSoup
+from yarl import URL
+
+from http_client import get_session, close_session
+
+
+# Built once here; passing a str makes aiohttp re-parse the URL into a
+# yarl.URL on every single request
+WIKI_RANDOM_URL = URL("https://en.wikipedia.org/wiki/Special:Random")
+
+
+# The only thing we use from each ~100KB page is the first <h1>'s text,
+# so a compiled regex over the raw bytes beats building a full DOM
+H1_RE = re.compile(rb"<h1[^>]*>(.*?)</h1>", re.DOTALL)
+TAG_RE = re.compile(rb"<[^>]+>")
+
+# Cap the number of in-flight requests so the concurrent fetches don't
+# trigger the very 429s that forced serial requests in the first place
+MAX_CONCURRENCY = 10
+
+
+def parse_title(page: bytes) -> str:
+    """ Pulls the first <h1>'s text out of a raw page (top-level so it pickles into worker processes) """
+    title = TAG_RE.sub(b"", H1_RE.search(page).group(1))
+    return html.unescape(title.decode("utf-8"))
+
+
+async def fetch_with_retry(client, url: URL, max_retries: int = 3):
+    """
+    Performs a GET, retrying 429/503 responses with capped exponential
+    backoff plus jitter (honoring Retry-After when the server sends one)
+    instead of failing the whole batch on the first 429
+    """
+    for attempt in range(max_retries + 1):
+        response = await client.get(url)
+        if response.status not in (429, 503) or attempt == max_retries:
+            return response
+
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None and retry_after.isdigit():
+            delay = int(retry_after)
+        else:
+            delay = min(30, 1.0 * 2 ** attempt) * (0.5 + random.random() * 0.5)
+
+        response.release()
+        await asyncio.sleep(delay)
+
+
+async def fetch_title(client, url: URL, pool, sem: asyncio.Semaphore, seen: set):
+    """ Fetches a single page, then parses its title in the process pool (returns None for an article we already scraped this run) """
+    async with sem:
+        async with await fetch_with_retry(client, url) as response:
+            if response.status > 399:
+                # Still a 429 after our retries, or some other failure
+                response.raise_for_status()
+
+            # Special:Random redirects to the chosen article; if the RNG
+            # hands us an article twice, skip the body read and re-parse
+            final_url = str(response.url)
+            if final_url in seen:
+                return None
+            seen.add(final_url)
+
+            page = await response.read()
+
+    # Parsing is the CPU-bound half of the job, so hand it to a worker
+    # process while the event loop keeps the requests flowing
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(pool, parse_title, page)
 
 
 async def get_and_scrape_pages(num_pages: int, output_file: str):
@@ -16,6 +84,10 @@ async def get_and_scrape_pages(num_pages: int, output_file: str):
     articles, then scrapes each page for its title and appends it to {{ output_file }},
     separating each title with a tab: "\\t"
 
+    All of the I/O happens on this one event loop; only the CPU-bound
+    parsing fans out to a ProcessPoolExecutor, so we keep a single warm
+    connection pool instead of one event loop + session per process.
+
     #### Arguments
     ---
     num_pages: int -
@@ -24,70 +96,58 @@ async def get_and_scrape_pages(num_pages: int, output_file: str):
     output_file: str -
         File to append titles to
     """
-    async with \
-    aiohttp.ClientSession() as client, \
-    aiofiles.open(output_file, "a+", encoding="utf-8") as f:
-
-        for _ in range(num_pages):
-            async with client.get("https://en.wikipedia.org/wiki/Special:Random") as response:
-                if response.status > 399:
-                    # I was getting a 429 Too Many Requests at a higher volume of requests
-                    response.raise_for_status()
-
-                page = await response.text()
-                soup = BeautifulSoup(page, features="html.parser")
-                title = soup.find("h1").text
-
-                await f.write(title + "\t")
+    client = await get_session()
+    seen = set() # Post-redirect URLs we've already scraped this run
+    # Created here so the semaphore belongs to the running event loop;
+    # at module scope it could bind to a different loop than asyncio.run's
+    sem = asyncio.Semaphore(MAX_CONCURRENCY)
+
+    with concurrent.futures.ProcessPoolExecutor(cpu_count()) as pool:
+        tasks = [
+            fetch_title(client, WIKI_RANDOM_URL, pool, sem, seen)
+            for _ in range(num_pages)
+        ]
+        # as_completed hands each title over the moment its request
+        # finishes, so parsing overlaps the remaining fetches instead of
+        # bursting after the slowest response lands; failures are skipped
+        # rather than aborting the whole batch
+        titles = []
+        for coro in asyncio.as_completed(tasks):
+            try:
+                title = await coro
+            except Exception as e:
+                print(f"Skipping a page that failed to fetch: {e!r}")
+                continue
+            if title is not None:
+                titles.append(title)
+
+    async with aiofiles.open(output_file, "a+", encoding="utf-8") as f:
+        await f.write("\t".join(titles) + "\n")
+
+    await close_session()
+
+
+async def main():
+    NUM_PAGES = 100 # Number of pages to scrape altogether
+    OUTPUT_FILE = "./wiki_titles.tsv" # File to append our scraped titles to
 
-        await f.write("\n")
+    await get_and_scrape_pages(NUM_PAGES, OUTPUT_FILE)
 
 
-def start_scraping(num_pages: int, output_file: str, i: int):
+if __name__ == "__main__":
     # On Windows, this finishes successfully, but throws 'RuntimeError: Event loop is closed'
     # The following lines fix this
     # Source: https://github.com/encode/httpx/issues/914#issuecomment-622586610
     if sys.version_info[0] == 3 and sys.version_info[1] >= 8 and sys.platform.startswith('win'):
         asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
-    """ Starts an async process for requesting and scraping Wikipedia pages """
-    print(f"Process {i} starting...")
-    asyncio.run(get_and_scrape_pages(num_pages, output_file))
-    print(f"Process {i} finished.")
-
-
-def main():
-    NUM_PAGES = 100 # Number of pages to scrape altogether
-    NUM_CORES = cpu_count() # Our number of CPU cores (including logical cores)
-    OUTPUT_FILE = "./wiki_titles.tsv" # File to append our scraped titles to
-
-    PAGES_PER_CORE = floor(NUM_PAGES / NUM_CORES)
-    PAGES_FOR_FINAL_CORE = PAGES_PER_CORE + NUM_PAGES % PAGES_PER_CORE # For our final core
-
-    futures = []
-
-    with concurrent.futures.ProcessPoolExecutor(NUM_CORES) as executor:
-        for i in range(NUM_CORES - 1):
-            new_future = executor.submit(
-                start_scraping, # Function to perform
-                # v Arguments v
-                num_pages=PAGES_PER_CORE,
-                output_file=OUTPUT_FILE,
-                i=i
-            )
-            futures.append(new_future)
-
-        futures.append(
-            executor.submit(
-                start_scraping,
-                PAGES_FOR_FINAL_CORE, OUTPUT_FILE, NUM_CORES-1
-            )
-        )
-
-    concurrent.futures.wait(futures)
-
-
-if __name__ == "__main__":
+    else:
+        try:
+            # uvloop is a drop-in, much faster event loop (Mac/Linux only)
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            pass
     print("Starting: Please wait (This may take a while)....")
     start = time.time()
-    main()
+    asyncio.run(main())
     print(f"Time to complete: {round(time.time() - start, 2)} seconds.")
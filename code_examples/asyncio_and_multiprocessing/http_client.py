@@ -0,0 +1,37 @@
+import aiohttp
+
+
+DEFAULT_HEADERS = {"User-Agent": "Mozilla/5.0"}
+
+_session = None
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """
+    Returns a lazily-created, process-wide aiohttp.ClientSession
+
+    Creating a new ClientSession for every batch also rebuilds its
+    TCPConnector (and connection pool), so every request pays a fresh
+    TCP + TLS handshake. Sharing one session lets requests to the same
+    host (Wikipedia is a single host) reuse keep-alive connections.
+    """
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=10,
+                enable_cleanup_closed=True
+            ),
+            timeout=aiohttp.ClientTimeout(total=60, connect=10),
+            headers=DEFAULT_HEADERS
+        )
+    return _session
+
+
+async def close_session():
+    """ Closes the shared session; call before the event loop shuts down """
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
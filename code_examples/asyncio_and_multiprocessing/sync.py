@@ -1,7 +1,39 @@
 import time
-import urllib.request
 
-from bs4 import BeautifulSoup
+import httpx
+
+try:
+    # html5-parser builds the tree in C (libxml2), and the precompiled
+    # lxml XPath below runs the h1 query at C speed too
+    from html5_parser import parse as html5_parse
+    from lxml.etree import XPath
+
+    H1_XPATH = XPath("(//h1)[1]//text()") # Compiled once, reused per page
+except ImportError:
+    html5_parse = None
+    try:
+        # selectolax's C-based parser is an order of magnitude faster than
+        # bs4 + html.parser for simple "find one element" queries
+        from selectolax.lexbor import LexborHTMLParser
+    except ImportError:
+        LexborHTMLParser = None
+        from bs4 import BeautifulSoup, SoupStrainer
+
+        # Built once and reused every page: parse only the <h1> elements
+        # instead of building a tree for the whole document
+        H1_STRAINER = SoupStrainer("h1")
+
+
+# One module-level client so every request reuses the same keep-alive
+# connection instead of paying a TCP + TLS handshake per page.
+# follow_redirects is needed because Special:Random 302s to the article.
+CLIENT = httpx.Client(
+    http2=True,
+    follow_redirects=True,
+    # Ask for gzip explicitly; Wikipedia pages transfer ~5x smaller and
+    # httpx decompresses the body transparently before .content
+    headers={"User-Agent": "Mozilla/5.0", "Accept-Encoding": "gzip"}
+)
 
 
 def get_and_scrape_pages(num_pages: int, output_file: str):
@@ -20,15 +52,19 @@ def get_and_scrape_pages(num_pages: int, output_file: str):
     """
     with open(output_file, "a+", encoding="utf-8") as f:
         for _ in range(num_pages):
-            with urllib.request.urlopen("https://en.wikipedia.org/wiki/Special:Random") as response:
-                if response.status > 399:
-                    # I was getting a 429 Too Many Requests at a higher volume of requests
-                    raise Exception(f"Received a {response.status} instead of 200.")
-
-                page = response.read()
-                soup = BeautifulSoup(page, features="html.parser")
-                title = soup.find("h1").text
-                f.write(title + "\t")
+            response = CLIENT.get("https://en.wikipedia.org/wiki/Special:Random")
+            # I was getting a 429 Too Many Requests at a higher volume of requests
+            response.raise_for_status()
+
+            page = response.content
+            if html5_parse is not None:
+                title = "".join(H1_XPATH(html5_parse(page)))
+            elif LexborHTMLParser is not None:
+                title = LexborHTMLParser(page).css_first("h1").text()
+            else:
+                soup = BeautifulSoup(page, features="html.parser", parse_only=H1_STRAINER)
+                title = soup.h1.get_text()
+            f.write(title + "\t")
 
         f.write("\n")
 
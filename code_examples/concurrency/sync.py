@@ -1,7 +1,8 @@
-import json
 import time
 from urllib.request import Request, urlopen
 
+import orjson
+
 
 def write_genre(file_name):
     """
@@ -10,7 +11,9 @@ def write_genre(file_name):
     """
 
     req = Request("https://binaryjazz.us/wp-json/genrenator/v1/genre/", headers={"User-Agent": "Mozilla/5.0"})
-    genre = json.load(urlopen(req))
+    # orjson decodes the payload several times faster than the
+    # pure-Python json module
+    genre = orjson.loads(urlopen(req).read())
 
     with open(file_name, "w") as new_file:
         print(f"Writing '{genre}' to '{file_name}'...")